@@ -0,0 +1,26 @@
+"""Console entry point for Bing Webmaster CLI."""
+
+from __future__ import annotations
+
+import sys
+
+PROG_NAME = "bwm"
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = sys.argv[1:] if argv is None else argv
+
+    # `bwm --version` needs neither Click nor any command module.
+    if args == ["--version"]:
+        from bingwm_cli import __version__
+
+        print(f"{PROG_NAME}, version {__version__}")
+        return
+
+    from bingwm_cli.cli import cli
+
+    cli.main(args=args, prog_name=PROG_NAME)
+
+
+if __name__ == "__main__":
+    main()
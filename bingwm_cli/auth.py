@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
+from bingwm_cli.jsoncodec import dumps_bytes, loads
 from bingwm_cli.paths import credentials_file
 
 API_KEY_ENV_VAR = "BING_WEBMASTER_API_KEY"
@@ -21,29 +21,32 @@ def save_api_key(api_key: str) -> Path:
 
     path = credentials_file()
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps({"api_key": value}, indent=2) + "\n", encoding="utf-8")
+    path.write_bytes(dumps_bytes({"api_key": value}, indent=True, newline=True))
     return path
 
 
 def clear_stored_api_key() -> bool:
     path = credentials_file()
-    if path.exists():
+    try:
         path.unlink()
-        return True
-    return False
+    except FileNotFoundError:
+        return False
+    return True
 
 
 def load_stored_api_key() -> str | None:
     path = credentials_file()
-    if not path.exists():
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
         return None
 
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
+        payload = loads(data)
+    except ValueError as exc:
         raise AuthError(f"Stored credentials are invalid JSON: {path}") from exc
 
-    value = payload.get("api_key")
+    value = payload.get("api_key") if isinstance(payload, dict) else None
     if not isinstance(value, str):
         raise AuthError(f"Stored credentials are missing 'api_key': {path}")
 
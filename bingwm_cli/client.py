@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-import json
 import os
 from datetime import date
-from urllib.parse import urlencode
+from functools import lru_cache
+from urllib.parse import quote
 
 import requests
 
 from bingwm_cli.dates import coerce_date_value
+from bingwm_cli.jsoncodec import loads
 
 BING_WEBMASTER_BASE_URL = "https://ssl.bing.com/webmaster/api.svc/json"
 
@@ -34,7 +35,7 @@ class BingWebmasterClient:
 
     def get_user_sites(self) -> list[dict]:
         data = self._call("GetUserSites", {})
-        return _extract_list(data, ["Results", "SiteInfo", "Sites"])
+        return _extract_list(data, ["SiteInfo", "Sites"])
 
     def get_rank_and_traffic_data(self, site_url: str, start_date: date, end_date: date) -> list[dict]:
         payload = {
@@ -43,7 +44,7 @@ class BingWebmasterClient:
             "endDate": _format_bing_date(end_date),
         }
         data = self._call("GetRankAndTrafficStats", payload)
-        rows = _extract_list(data, ["Results", "Data", "Rows"])
+        rows = _extract_list(data, ["Data", "Rows"])
         return _filter_rows_by_date_range(rows, start_date, end_date)
 
     def get_url_traffic_info(self, site_url: str, url: str, start_date: date, end_date: date) -> list[dict]:
@@ -54,7 +55,7 @@ class BingWebmasterClient:
             "endDate": _format_bing_date(end_date),
         }
         data = self._call("GetUrlTrafficInfo", payload)
-        rows = _extract_list(data, ["Results", "Data", "Rows"])
+        rows = _extract_list(data, ["Data", "Rows"])
         if rows:
             return _filter_rows_by_date_range(rows, start_date, end_date)
         fallback_rows = [data] if data else []
@@ -69,7 +70,7 @@ class BingWebmasterClient:
 
     def get_crawl_issues(self, site_url: str) -> list[dict]:
         data = self._call("GetCrawlIssues", {"siteUrl": site_url})
-        return _extract_list(data, ["Results", "CrawlIssues", "UrlWithCrawlIssues"])
+        return _extract_list(data, ["CrawlIssues", "UrlWithCrawlIssues"])
 
     def submit_url(self, site_url: str, url: str) -> dict:
         return self._call("SubmitUrl", {"siteUrl": site_url, "url": url})
@@ -80,19 +81,19 @@ class BingWebmasterClient:
     def _call(self, method: str, payload: dict) -> dict:
         method_mode = _http_mode(method)
         if method_mode == "GET":
-            query = {"apikey": self.api_key, **payload}
-            url = f"{self.base_url}/{method}?{urlencode(query)}"
+            url = f"{self.base_url}/{method}?{_encode_query(self.api_key, payload)}"
             response = self.session.get(url, timeout=self.timeout)
         else:
             url = f"{self.base_url}/{method}?apikey={self.api_key}"
             response = self.session.post(url, json=payload, timeout=self.timeout)
 
         if response.status_code >= 400:
-            detail = _extract_error_text(response)
+            error_payload = _safe_json(response)
+            detail = _extract_error_text(response, error_payload)
             raise BingAPIError(
                 f"{method} failed ({response.status_code}): {detail}",
                 status_code=response.status_code,
-                payload=_safe_json(response),
+                payload=error_payload,
             )
 
         body = _safe_json(response)
@@ -120,8 +121,7 @@ class BingWebmasterClient:
         return container
 
 
-def _extract_error_text(response: requests.Response) -> str:
-    payload = _safe_json(response)
+def _extract_error_text(response: requests.Response, payload) -> str:
     if isinstance(payload, dict):
         for key in ("Message", "message", "error_description", "error"):
             value = payload.get(key)
@@ -134,34 +134,55 @@ def _extract_error_text(response: requests.Response) -> str:
             if isinstance(message, str) and message.strip():
                 return message
 
-    return response.text.strip() or "Unknown error"
+    # Decode directly; response.text would run charset detection on the body.
+    return response.content.decode("utf-8", errors="replace").strip() or "Unknown error"
 
 
 def _safe_json(response: requests.Response):
+    # Bing serves UTF-8 JSON; parsing the raw bytes skips requests' encoding
+    # sniffing in response.text/response.json().
     try:
-        return response.json()
+        return loads(response.content)
     except ValueError:
         return {}
 
 
 def _extract_list(payload: dict, preferred_keys: list[str]) -> list[dict]:
+    # Nearly every Bing method wraps its rows in "Results"; check it first.
+    value = payload.get("Results")
+    if isinstance(value, list):
+        return _dict_items(value)
+
     for key in preferred_keys:
         value = payload.get(key)
         if isinstance(value, list):
-            return [item for item in value if isinstance(item, dict)]
+            return _dict_items(value)
 
     # Fallback for envelopes that return a single list-valued key.
     for value in payload.values():
         if isinstance(value, list):
-            return [item for item in value if isinstance(item, dict)]
+            return _dict_items(value)
 
     return []
 
 
+def _dict_items(values: list) -> list[dict]:
+    return [item for item in values if isinstance(item, dict)]
+
+
+@lru_cache(maxsize=256)
 def _format_bing_date(value: date) -> str:
     return f"{value.month}/{value.day}/{value.year}"
 
 
+def _encode_query(api_key: str, payload: dict) -> str:
+    # Parameter names are fixed ASCII identifiers; only the values need escaping.
+    query = f"apikey={quote(api_key, safe='')}"
+    for key, value in payload.items():
+        query += f"&{key}={quote(str(value), safe='')}"
+    return query
+
+
 def _http_mode(method: str) -> str:
     if method.startswith("Get"):
         return "GET"
@@ -0,0 +1 @@
+"""Click command groups, imported lazily by bingwm_cli.cli."""
@@ -0,0 +1,46 @@
+"""`bwm auth` commands."""
+
+from __future__ import annotations
+
+import click
+
+from bingwm_cli.auth import auth_status, clear_stored_api_key, save_api_key
+from bingwm_cli.commands.common import command_errors, render_records
+
+
+@click.group("auth")
+def auth() -> None:
+    """Manage API key authentication."""
+
+
+@auth.command("login")
+@click.option("--api-key", help="Bing Webmaster API key.")
+@command_errors
+def auth_login(api_key: str | None) -> None:
+    """Store API key locally for future CLI calls."""
+    key = api_key
+    if not key:
+        key = click.prompt("Bing Webmaster API key", hide_input=True, type=str)
+
+    path = save_api_key(key)
+    click.echo(f"Saved API key to {path}")
+
+
+@auth.command("whoami")
+@click.option("--output", "output_format", type=click.Choice(["table", "json"]), default="table")
+@command_errors
+def auth_whoami(output_format: str) -> None:
+    """Show current auth source and key fingerprint."""
+    status = auth_status()
+    click.echo(render_records([status], output_format=output_format))
+
+
+@auth.command("clear")
+@command_errors
+def auth_clear() -> None:
+    """Clear locally stored API key file."""
+    deleted = clear_stored_api_key()
+    if deleted:
+        click.echo("Removed local API key file.")
+    else:
+        click.echo("No local API key file found.")
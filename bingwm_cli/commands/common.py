@@ -0,0 +1,97 @@
+"""Helpers shared by the CLI command modules."""
+
+from __future__ import annotations
+
+from functools import wraps
+from typing import TYPE_CHECKING
+
+import click
+
+from bingwm_cli.auth import AuthError, load_api_key
+from bingwm_cli.config import ConfigError, get_default_site
+
+if TYPE_CHECKING:
+    from datetime import date
+
+    from bingwm_cli.client import BingWebmasterClient
+
+USER_INPUT_EXIT_CODE = 2
+AUTH_EXIT_CODE = 3
+API_EXIT_CODE = 4
+
+
+def command_errors(func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except (ValueError, ConfigError) as exc:
+            click.echo(f"Error: {exc}", err=True)
+            raise click.exceptions.Exit(USER_INPUT_EXIT_CODE) from exc
+        except AuthError as exc:
+            click.echo(f"Auth error: {exc}", err=True)
+            raise click.exceptions.Exit(AUTH_EXIT_CODE) from exc
+        except Exception as exc:
+            if not isinstance(exc, _api_error_types()):
+                raise
+            click.echo(f"API error: {exc}", err=True)
+            raise click.exceptions.Exit(API_EXIT_CODE) from exc
+
+    return wrapper
+
+
+def _api_error_types() -> tuple[type[Exception], ...]:
+    # requests is only imported once a client is built; defer it so --help and
+    # local-only commands never pay for loading it.
+    import requests
+
+    from bingwm_cli.client import BingAPIError
+
+    return (BingAPIError, requests.RequestException)
+
+
+def render_records(records: list[dict], output_format: str, csv_path: str | None = None) -> str:
+    from bingwm_cli.output import render_records as _render_records
+
+    return _render_records(records, output_format=output_format, csv_path=csv_path)
+
+
+def build_client(*, write: bool = False) -> BingWebmasterClient:
+    # API key permission is managed server-side by Bing; write flag is kept for parity/future checks.
+    del write
+    from bingwm_cli.client import BingWebmasterClient
+
+    key, _source = load_api_key()
+    return BingWebmasterClient(api_key=key)
+
+
+def resolve_site(site_url: str | None) -> str:
+    if site_url and site_url.strip():
+        return site_url.strip()
+
+    default_site = get_default_site()
+    if default_site:
+        return default_site
+
+    raise ValueError(
+        "No site specified. Pass --site or set one with `bwm config set default-site <siteUrl>`."
+    )
+
+
+def resolve_date_range(start_date: str | None, end_date: str | None) -> tuple[date, date]:
+    from datetime import date, timedelta
+
+    end = parse_date(end_date) if end_date else date.today()
+    start = parse_date(start_date) if start_date else end - timedelta(days=30)
+    if start > end:
+        raise ValueError("start-date cannot be after end-date")
+    return start, end
+
+
+def parse_date(value: str) -> date:
+    from datetime import datetime
+
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError as exc:
+        raise ValueError(f"Invalid date '{value}'. Expected YYYY-MM-DD.") from exc
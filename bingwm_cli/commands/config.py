@@ -0,0 +1,43 @@
+"""`bwm config` commands."""
+
+from __future__ import annotations
+
+import click
+
+from bingwm_cli.commands.common import command_errors
+from bingwm_cli.config import get_default_site, set_default_site
+
+
+@click.group("config")
+def config() -> None:
+    """Manage CLI configuration."""
+
+
+@config.group("set")
+def config_set() -> None:
+    """Set config values."""
+
+
+@config_set.command("default-site")
+@click.argument("site_url")
+@command_errors
+def config_set_default_site(site_url: str) -> None:
+    """Set default site URL used when --site is omitted."""
+    path = set_default_site(site_url)
+    click.echo(f"Set default-site to {site_url}")
+    click.echo(f"Config file: {path}")
+
+
+@config.group("get")
+def config_get() -> None:
+    """Get config values."""
+
+
+@config_get.command("default-site")
+@command_errors
+def config_get_default_site() -> None:
+    """Get default site URL."""
+    site_url = get_default_site()
+    if not site_url:
+        raise ValueError("default-site is not set.")
+    click.echo(site_url)
@@ -0,0 +1,39 @@
+"""`bwm site` commands."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import click
+
+from bingwm_cli.commands.common import build_client, command_errors, render_records
+
+if TYPE_CHECKING:
+    from bingwm_cli.client import BingWebmasterClient
+
+
+@click.group("site")
+def site() -> None:
+    """Site-level Bing Webmaster commands."""
+
+
+@site.command("list")
+@click.option("--output", "output_format", type=click.Choice(["table", "json", "csv"]), default="table")
+@click.option("--csv-path", type=click.Path(dir_okay=False, path_type=str), help="CSV path when --output=csv")
+@command_errors
+def site_list(output_format: str, csv_path: str | None) -> None:
+    """List websites available to this API key."""
+    records = _cmd_site_list(build_client())
+    click.echo(render_records(records, output_format=output_format, csv_path=csv_path))
+
+
+def _cmd_site_list(client: BingWebmasterClient) -> list[dict]:
+    return [_normalize_site_record(item) for item in client.get_user_sites()]
+
+
+def _normalize_site_record(item: dict) -> dict:
+    return {
+        "siteUrl": item.get("Url") or item.get("siteUrl") or item.get("SiteUrl") or "",
+        "permissionLevel": item.get("PermissionLevel") or item.get("permissionLevel") or "",
+        "isVerified": item["IsVerified"] if "IsVerified" in item else item.get("isVerified"),
+    }
@@ -0,0 +1,98 @@
+"""`bwm stats` commands."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import click
+
+from bingwm_cli.commands.common import build_client, command_errors, render_records, resolve_date_range, resolve_site
+
+if TYPE_CHECKING:
+    from datetime import date
+
+    from bingwm_cli.client import BingWebmasterClient
+
+
+@click.group("stats")
+def stats() -> None:
+    """Traffic/ranking statistics commands."""
+
+
+@stats.command("site")
+@click.option("--site", "site_url", help="Site URL. Falls back to configured default site.")
+@click.option(
+    "--start-date",
+    type=str,
+    help="Start date (YYYY-MM-DD). Defaults to 30 days ago. CLI filters returned rows locally because Bing ignores date range params for this endpoint.",
+)
+@click.option(
+    "--end-date",
+    type=str,
+    help="End date (YYYY-MM-DD). Defaults to today. CLI filters returned rows locally because Bing ignores date range params for this endpoint.",
+)
+@click.option("--output", "output_format", type=click.Choice(["table", "json", "csv"]), default="table")
+@click.option("--csv-path", type=click.Path(dir_okay=False, path_type=str), help="CSV path when --output=csv")
+@command_errors
+def stats_site(
+    site_url: str | None,
+    start_date: str | None,
+    end_date: str | None,
+    output_format: str,
+    csv_path: str | None,
+) -> None:
+    """Get site-level rank and traffic statistics, filtered locally to the requested date range."""
+    resolved_site = resolve_site(site_url)
+    start, end = resolve_date_range(start_date, end_date)
+    records = _cmd_stats_site(build_client(), resolved_site, start, end)
+    click.echo(render_records(records, output_format=output_format, csv_path=csv_path))
+
+
+@stats.command("url")
+@click.option("--site", "site_url", help="Site URL. Falls back to configured default site.")
+@click.option("--url", "url_value", required=True, help="Page URL.")
+@click.option(
+    "--start-date",
+    type=str,
+    help="Start date (YYYY-MM-DD). Defaults to 30 days ago. CLI filters returned rows locally because Bing ignores date range params for this endpoint.",
+)
+@click.option(
+    "--end-date",
+    type=str,
+    help="End date (YYYY-MM-DD). Defaults to today. CLI filters returned rows locally because Bing ignores date range params for this endpoint.",
+)
+@click.option("--output", "output_format", type=click.Choice(["table", "json", "csv"]), default="table")
+@click.option("--csv-path", type=click.Path(dir_okay=False, path_type=str), help="CSV path when --output=csv")
+@command_errors
+def stats_url(
+    site_url: str | None,
+    url_value: str,
+    start_date: str | None,
+    end_date: str | None,
+    output_format: str,
+    csv_path: str | None,
+) -> None:
+    """Get traffic statistics for a specific URL, filtered locally to the requested date range."""
+    resolved_site = resolve_site(site_url)
+    start, end = resolve_date_range(start_date, end_date)
+    records = _cmd_stats_url(build_client(), resolved_site, url_value, start, end)
+    click.echo(render_records(records, output_format=output_format, csv_path=csv_path))
+
+
+def _cmd_stats_site(client: BingWebmasterClient, resolved_site: str, start: date, end: date) -> list[dict]:
+    rows = client.get_rank_and_traffic_data(resolved_site, start, end)
+    return [_normalize_stat_record(row, resolved_site=resolved_site) for row in rows]
+
+
+def _cmd_stats_url(client: BingWebmasterClient, resolved_site: str, url_value: str, start: date, end: date) -> list[dict]:
+    rows = client.get_url_traffic_info(resolved_site, url_value, start, end)
+    return [_normalize_stat_record(row, resolved_site=resolved_site, url_value=url_value) for row in rows]
+
+
+def _normalize_stat_record(row: dict, *, resolved_site: str, url_value: str | None = None) -> dict:
+    # Rows are freshly decoded per call and owned by the command, so they are
+    # filled in place rather than copied; long date ranges can return many rows.
+    row.setdefault("siteUrl", resolved_site)
+    if url_value:
+        row.setdefault("url", url_value)
+    return row
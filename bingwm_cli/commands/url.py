@@ -0,0 +1,257 @@
+"""`bwm url` commands."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import click
+
+from bingwm_cli.commands.common import build_client, command_errors, render_records, resolve_site
+from bingwm_cli.dates import BING_EPOCH_PLACEHOLDERS
+from bingwm_cli.jsoncodec import dumps
+
+if TYPE_CHECKING:
+    from bingwm_cli.client import BingWebmasterClient
+
+CRAWL_ISSUE_FLAGS = {
+    0: "None",
+    1: "NotFound",
+    2: "BlockedByRobotsTxt",
+    4: "DisallowedByMetaTag",
+    8: "Timeout",
+    16: "ConnectionAborted",
+    32: "ContainsMalware",
+    64: "ContainsVirus",
+    128: "InternalServerError",
+    256: "UnsupportedContentType",
+}
+_ISSUE_FLAG_NAMES = {flag: name for flag, name in CRAWL_ISSUE_FLAGS.items() if flag}
+
+# Bing encodes "no date" as /Date(-62135568000000-0800)/ (0001-01-01).
+_BING_SENTINEL_DATE = "-62135568000000"
+_SENTINEL_DATE_FIELDS = ("DiscoveryDate", "LastCrawledDate")
+
+
+@click.group("url")
+def url() -> None:
+    """URL-level status and submission commands."""
+
+
+@url.command("check-index")
+@click.option("--site", "site_url", help="Site URL. Falls back to configured default site.")
+@click.option("--url", "url_value", required=True, help="Page URL to inspect.")
+@click.option("--output", "output_format", type=click.Choice(["table", "json"]), default="table")
+@click.option("--explain", is_flag=True, help="Include richer diagnostics based on available API signals.")
+@command_errors
+def url_check_index(site_url: str | None, url_value: str, output_format: str, explain: bool) -> None:
+    """Check if a URL is indexed by Bing and show known reasons if not."""
+    resolved_site = resolve_site(site_url)
+    record = _cmd_url_check_index(build_client(), resolved_site, url_value, explain=explain)
+    click.echo(render_records([record], output_format=output_format))
+
+
+@url.command("submit")
+@click.option("--site", "site_url", help="Site URL. Falls back to configured default site.")
+@click.option("--url", "urls", multiple=True, help="URL to submit (repeatable).")
+@click.option(
+    "--file",
+    "file_path",
+    type=click.Path(exists=True, dir_okay=False, path_type=str),
+    help="Text file with one URL per line.",
+)
+@click.option("--output", "output_format", type=click.Choice(["table", "json"]), default="table")
+@command_errors
+def url_submit(site_url: str | None, urls: tuple[str, ...], file_path: str | None, output_format: str) -> None:
+    """Submit one or more URLs for Bing indexing."""
+    resolved_site = resolve_site(site_url)
+    url_list = _collect_urls(urls, file_path)
+    if not url_list:
+        raise ValueError("Provide at least one URL via --url or --file.")
+
+    record = _cmd_url_submit(build_client(write=True), resolved_site, url_list)
+    click.echo(render_records([record], output_format=output_format))
+
+
+def _cmd_url_check_index(client: BingWebmasterClient, resolved_site: str, url_value: str, *, explain: bool = False) -> dict:
+    info = client.get_url_info(resolved_site, url_value)
+    sentinels = _scan_sentinel_dates(info)
+    indexed = _extract_is_indexed(info, sentinels)
+    reason = ""
+    matched_issue = None
+    matched_issue_raw = ""
+    explanations: list[str] = []
+
+    if not indexed:
+        crawl_issues = client.get_crawl_issues(resolved_site)
+        matched_issue = _find_crawl_issue_for_url(crawl_issues, url_value)
+        if matched_issue:
+            # Serialize once; the raw form feeds both the reason and crawlIssueRaw.
+            matched_issue_raw = dumps(matched_issue)
+            reason = _format_issue_reason(matched_issue, matched_issue_raw)
+            explanations.append(f"Crawl issue: {reason}")
+        else:
+            reason = "No explicit crawl issue returned by Bing API for this URL."
+            explanations.append(reason)
+
+        if explain:
+            explanations.extend(_build_explanation_hints(info, sentinels))
+
+    record = {
+        "siteUrl": resolved_site,
+        "url": url_value,
+        "isIndexed": indexed,
+        "reason": reason,
+    }
+    record.update(_pick_fields(info, ["HttpCode", "CrawlDate", "Date", "IsPage", "Indexable", "LastCrawlTime"]))
+    if matched_issue:
+        record.update(
+            {
+                "crawlIssueCode": matched_issue.get("Issues") or matched_issue.get("Issue"),
+                "crawlIssueRaw": matched_issue_raw,
+            }
+        )
+    if explain:
+        record["explanation"] = " | ".join(_unique_non_empty(explanations)) if explanations else ""
+    return record
+
+
+def _cmd_url_submit(client: BingWebmasterClient, resolved_site: str, url_list: list[str]) -> dict:
+    if len(url_list) == 1:
+        response = client.submit_url(resolved_site, url_list[0])
+    else:
+        response = client.submit_url_batch(resolved_site, url_list)
+
+    return {
+        "siteUrl": resolved_site,
+        "submittedCount": len(url_list),
+        "status": "submitted",
+        "response": dumps(response),
+    }
+
+
+def _scan_sentinel_dates(info: dict) -> set[str]:
+    return {key for key in _SENTINEL_DATE_FIELDS if _is_sentinel_date(info.get(key))}
+
+
+def _is_sentinel_date(value: object) -> bool:
+    if not isinstance(value, str):
+        return False
+    return _BING_SENTINEL_DATE in value or value in BING_EPOCH_PLACEHOLDERS
+
+
+def _extract_is_indexed(info: dict, sentinels: set[str] | None = None) -> bool:
+    for key in ("IsIndexed", "isIndexed", "Indexed", "indexable"):
+        value = info.get(key)
+        if isinstance(value, bool):
+            return value
+
+    # Bing's GetUrlInfo may return IsPage=true even when URL is blocked/not serving.
+    http_status = info.get("HttpStatus")
+    last_crawled = info.get("LastCrawledDate")
+    is_page = info.get("IsPage")
+    discovery_date = info.get("DiscoveryDate")
+
+    if isinstance(is_page, bool) and not is_page:
+        return False
+
+    if sentinels is None:
+        sentinels = _scan_sentinel_dates(info)
+    has_valid_crawl = isinstance(last_crawled, str) and "LastCrawledDate" not in sentinels
+    has_valid_discovery = isinstance(discovery_date, str) and "DiscoveryDate" not in sentinels
+    has_success_status = http_status == 200
+
+    return bool(has_success_status and (has_valid_crawl or has_valid_discovery))
+
+
+def _find_crawl_issue_for_url(crawl_issues: list[dict], url_value: str) -> dict | None:
+    url_lower = url_value.strip().lower()
+    for issue in crawl_issues:
+        issue_url = issue.get("Url") or issue.get("url")
+        if isinstance(issue_url, str) and issue_url.strip().lower() == url_lower:
+            return issue
+    return None
+
+
+def _format_issue_reason(issue: dict, issue_raw: str | None = None) -> str:
+    code = issue.get("Issues") or issue.get("Issue")
+    if isinstance(code, int):
+        names = _decode_issue_flags(code)
+        return ", ".join(names) if names else f"Unknown issue code: {code}"
+    return f"Issue details: {issue_raw if issue_raw is not None else dumps(issue)}"
+
+
+def _decode_issue_flags(code: int) -> list[str]:
+    if code == 0:
+        return ["None"]
+
+    names: list[str] = []
+    unknown = 0
+    remaining = code
+    # Visit set bits only, lowest first, so names keep ascending flag order.
+    while remaining > 0:
+        bit = remaining & -remaining
+        remaining ^= bit
+        name = _ISSUE_FLAG_NAMES.get(bit)
+        if name:
+            names.append(name)
+        else:
+            unknown |= bit
+    unknown |= remaining
+
+    if unknown:
+        names.append(f"Unknown({unknown})")
+    return names
+
+
+def _pick_fields(payload: dict, keys: list[str]) -> dict:
+    result: dict = {}
+    for key in keys:
+        if key in payload:
+            result[key[0].lower() + key[1:]] = payload[key]
+    return result
+
+
+def _build_explanation_hints(info: dict, sentinels: set[str] | None = None) -> list[str]:
+    hints: list[str] = []
+    if sentinels is None:
+        sentinels = _scan_sentinel_dates(info)
+
+    http_status = info.get("HttpStatus")
+    if http_status == 0:
+        hints.append("Bing reports HttpStatus=0 for this URL, which usually means no successful fetch was recorded.")
+    elif isinstance(http_status, int):
+        hints.append(f"Bing reports last known HttpStatus={http_status}.")
+
+    if "DiscoveryDate" in sentinels:
+        hints.append("DiscoveryDate is empty/sentinel in API, suggesting Bing has not discovered crawlable content for this URL.")
+
+    if "LastCrawledDate" in sentinels:
+        hints.append("LastCrawledDate is empty/sentinel in API, suggesting the URL has not been crawled successfully.")
+
+    anchor_count = info.get("AnchorCount")
+    if isinstance(anchor_count, int) and anchor_count == 0:
+        hints.append("AnchorCount=0 in API, meaning Bing has no known inbound link signals for this URL.")
+
+    document_size = info.get("DocumentSize")
+    if isinstance(document_size, int) and document_size == 0:
+        hints.append("DocumentSize=0 in API, indicating Bing has not stored page content for this URL.")
+
+    return hints
+
+
+def _unique_non_empty(items: list[str]) -> list[str]:
+    return list(dict.fromkeys(value for value in (item.strip() for item in items) if value))
+
+
+def _collect_urls(urls: tuple[str, ...], file_path: str | None) -> list[str]:
+    items = [item.strip() for item in urls if item and item.strip()]
+
+    if file_path:
+        # Split and strip as str: copy-pasted lists carry NBSPs and Unicode line breaks.
+        for line in Path(file_path).read_bytes().decode("utf-8").splitlines():
+            stripped = line.strip()
+            if stripped and not stripped.startswith("#"):
+                items.append(stripped)
+
+    return list(dict.fromkeys(items))
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
+from bingwm_cli.jsoncodec import dumps_bytes, loads
 from bingwm_cli.paths import app_config_file
 
 
@@ -14,19 +14,21 @@ class ConfigError(RuntimeError):
 
 def load_config() -> dict:
     path = app_config_file()
-    if not path.exists():
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
         return {}
 
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
+        return loads(data)
+    except ValueError as exc:
         raise ConfigError(f"Config file is not valid JSON: {path}") from exc
 
 
 def save_config(config: dict) -> Path:
     path = app_config_file()
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(config, indent=2) + "\n", encoding="utf-8")
+    path.write_bytes(dumps_bytes(config, indent=True, newline=True))
     return path
 
 
@@ -7,10 +7,16 @@ from datetime import date, datetime, timedelta, timezone
 
 _BING_DATE_RE = re.compile(r"^/?Date\((?P<millis>-?\d+)(?P<offset>[+-]\d{4})?\)/?$")
 _BING_SENTINEL_MILLIS = -62135568000000
+# Other spellings of 0001-01-01 that Bing uses for "no date".
+BING_EPOCH_PLACEHOLDERS = frozenset({"/Date(-62135596800000-0800)/", "0001-01-01T00:00:00"})
 
 
 def normalize_bing_date_string(value: str) -> str:
-    match = _BING_DATE_RE.fullmatch(value.strip())
+    stripped = value.strip()
+    if stripped in BING_EPOCH_PLACEHOLDERS:
+        return ""
+
+    match = _BING_DATE_RE.fullmatch(stripped)
     if not match:
         return value
 
@@ -0,0 +1,40 @@
+"""JSON encode/decode helpers, backed by orjson when it is installed."""
+
+from __future__ import annotations
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+
+    def loads(data: bytes | str):
+        return orjson.loads(data)
+
+    def dumps(value, *, indent: bool = False) -> str:
+        return dumps_bytes(value, indent=indent).decode("utf-8")
+
+    def dumps_bytes(value, *, indent: bool = False, newline: bool = False) -> bytes:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(value, option=option)
+
+else:
+    import json
+
+    def loads(data: bytes | str):
+        return json.loads(data)
+
+    def dumps(value, *, indent: bool = False) -> str:
+        # Match orjson's output: compact separators, UTF-8 kept as-is.
+        if indent:
+            return json.dumps(value, indent=2, ensure_ascii=False)
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+    def dumps_bytes(value, *, indent: bool = False, newline: bool = False) -> bytes:
+        text = dumps(value, indent=indent)
+        if newline:
+            text += "\n"
+        return text.encode("utf-8")
@@ -3,17 +3,19 @@
 from __future__ import annotations
 
 import csv
-import json
 from pathlib import Path
 
 from bingwm_cli.dates import normalize_bing_date_string
+from bingwm_cli.jsoncodec import dumps
+
+_CSV_BUFFER_SIZE = 1 << 17
 
 
 def render_records(records: list[dict], output_format: str, csv_path: str | None = None) -> str:
     normalized_records = [_normalize_value(record) for record in records]
 
     if output_format == "json":
-        return json.dumps(normalized_records, indent=2)
+        return dumps(normalized_records, indent=True)
 
     if output_format == "csv":
         if not csv_path:
@@ -29,50 +31,45 @@ def render_records(records: list[dict], output_format: str, csv_path: str | None
 
 def _write_csv(records: list[dict], csv_path: str) -> None:
     path = Path(csv_path)
-    fieldnames: list[str] = []
-
-    for record in records:
-        for key in record.keys():
-            if key not in fieldnames:
-                fieldnames.append(key)
+    fieldnames = _collect_fieldnames(records)
 
-    with path.open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
+    with path.open("w", newline="", encoding="utf-8", buffering=_CSV_BUFFER_SIZE) as handle:
         if fieldnames:
-            writer.writeheader()
-            writer.writerows(records)
+            writer = csv.writer(handle)
+            writer.writerow(fieldnames)
+            writer.writerows([record.get(key) for key in fieldnames] for record in records)
+
+
+def _collect_fieldnames(records: list[dict]) -> list[str]:
+    if not records:
+        return []
+
+    # Bing rows almost always share one schema; only merge keys when they differ.
+    first_keys = records[0].keys()
+    if all(record.keys() == first_keys for record in records):
+        return list(first_keys)
+
+    return list(dict.fromkeys(key for record in records for key in record))
 
 
 def _render_table(records: list[dict]) -> str:
     if not records:
         return "No rows found."
 
-    headers: list[str] = []
-    for record in records:
-        for key in record.keys():
-            if key not in headers:
-                headers.append(key)
-
-    widths = {key: len(key) for key in headers}
-    for record in records:
-        for key in headers:
-            cell = "" if record.get(key) is None else str(record.get(key))
-            widths[key] = max(widths[key], len(cell))
+    headers = _collect_fieldnames(records)
+    rows = [[_table_cell(record.get(key)) for key in headers] for record in records]
+    widths = [max(len(header), *(len(row[index]) for row in rows)) for index, header in enumerate(headers)]
 
     lines = [
-        " | ".join(key.ljust(widths[key]) for key in headers),
-        "-+-".join("-" * widths[key] for key in headers),
+        " | ".join(header.ljust(width) for header, width in zip(headers, widths)),
+        "-+-".join("-" * width for width in widths),
     ]
+    lines.extend(" | ".join(cell.ljust(width) for cell, width in zip(row, widths)) for row in rows)
+    return "\n".join(lines)
 
-    for record in records:
-        lines.append(
-            " | ".join(
-                ("" if record.get(key) is None else str(record.get(key))).ljust(widths[key])
-                for key in headers
-            )
-        )
 
-    return "\n".join(lines)
+def _table_cell(value) -> str:
+    return "" if value is None else str(value)
 
 
 def _normalize_value(value):
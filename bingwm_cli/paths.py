@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
+# Paths are resolved once per process; callers that change the BWM_* variables
+# afterwards (tests) must call cache_clear() on these helpers.
 
+
+@lru_cache(maxsize=1)
 def config_dir() -> Path:
     env_value = os.environ.get("BWM_CONFIG_DIR")
     if env_value:
@@ -13,6 +18,7 @@ def config_dir() -> Path:
     return Path.home() / ".config" / "bing-webmaster-cli"
 
 
+@lru_cache(maxsize=1)
 def credentials_file() -> Path:
     env_value = os.environ.get("BWM_CREDENTIALS_FILE")
     if env_value:
@@ -20,6 +26,7 @@ def credentials_file() -> Path:
     return config_dir() / "credentials.json"
 
 
+@lru_cache(maxsize=1)
 def app_config_file() -> Path:
     env_value = os.environ.get("BWM_APP_CONFIG_FILE")
     if env_value:
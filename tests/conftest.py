@@ -1,4 +1,8 @@
 import pytest
+from click.testing import CliRunner
+
+from bingwm_cli import paths
+from bingwm_cli.client import BingWebmasterClient
 
 
 @pytest.fixture(autouse=True)
@@ -8,3 +12,68 @@ def isolate_user_files(tmp_path, monkeypatch):
     monkeypatch.setenv("BWM_APP_CONFIG_FILE", str(config_dir / "config.json"))
     monkeypatch.setenv("BWM_CREDENTIALS_FILE", str(config_dir / "credentials.json"))
     monkeypatch.delenv("BING_WEBMASTER_API_KEY", raising=False)
+
+    for helper in (paths.config_dir, paths.credentials_file, paths.app_config_file):
+        helper.cache_clear()
+
+
+class FakeClient:
+    def __init__(self):
+        self.submitted = None
+
+    def get_user_sites(self):
+        return [{"Url": "https://example.com", "PermissionLevel": "Admin"}]
+
+    def get_rank_and_traffic_data(self, site_url, start_date, end_date):
+        assert site_url == "https://example.com"
+        return [{"Date": "2026-02-20", "Clicks": 10, "Impressions": 100}]
+
+    def get_url_traffic_info(self, site_url, url, start_date, end_date):
+        return [{"Date": "2026-02-20", "Clicks": 3, "Impressions": 25, "Url": url}]
+
+    def get_url_info(self, site_url, url):
+        return {"Url": url, "IsPage": False, "HttpCode": 404}
+
+    def get_crawl_issues(self, site_url):
+        return [{"Url": "https://example.com/missing", "Issues": 1}]
+
+    def submit_url(self, site_url, url):
+        self.submitted = (site_url, [url])
+        return {"Accepted": True}
+
+    def submit_url_batch(self, site_url, urls):
+        self.submitted = (site_url, urls)
+        return {"Accepted": True, "Count": len(urls)}
+
+
+# FakeClient keeps no state besides ``submitted``, so one instance is shared.
+_SHARED_FAKE_CLIENT = FakeClient()
+
+
+@pytest.fixture
+def patched_cli(monkeypatch):
+    """Route CLI commands to the shared FakeClient and a fixed default site."""
+    fake = _SHARED_FAKE_CLIENT
+    fake.submitted = None
+    for module in ("site", "stats", "url"):
+        monkeypatch.setattr(f"bingwm_cli.commands.{module}.build_client", lambda write=False: fake)
+    monkeypatch.setattr("bingwm_cli.commands.common.get_default_site", lambda: "https://example.com")
+    return fake
+
+
+@pytest.fixture(scope="module")
+def _module_bing_client():
+    return BingWebmasterClient("k")
+
+
+@pytest.fixture
+def bing_client(_module_bing_client):
+    """One client per test module; each test installs its own fake session."""
+    yield _module_bing_client
+    _module_bing_client.session = None
+
+
+@pytest.fixture(scope="session")
+def runner():
+    # invoke() isolates stdio and env per call, so one runner serves every test.
+    return CliRunner()
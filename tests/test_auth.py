@@ -1,10 +1,22 @@
 import json
+import os
+from pathlib import Path
 
 import pytest
 
 from bingwm_cli.auth import AuthError, auth_status, clear_stored_api_key, load_api_key, save_api_key
 from bingwm_cli.paths import credentials_file
 
+_NOT_JSON = b"not-json"
+_MISSING_FIELD_JSON = json.dumps({"token": "x"}).encode("utf-8")
+_NON_OBJECT_JSON = json.dumps(["abc"]).encode("utf-8")
+
+
+def _write_credentials(data):
+    path = credentials_file()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
 
 def test_save_and_load_api_key_local():
     path = save_api_key("abc123")
@@ -15,6 +27,20 @@ def test_save_and_load_api_key_local():
     assert source == "local"
 
 
+def test_credentials_round_trip_on_disk():
+    expected_path = Path(os.environ["BWM_CREDENTIALS_FILE"])
+    assert not expected_path.parent.exists()
+
+    path = save_api_key("abc123")
+
+    assert path == expected_path
+    assert load_api_key() == ("abc123", "local")
+    assert auth_status()["credentials_path"] == str(expected_path)
+    assert clear_stored_api_key() is True
+    assert not expected_path.exists()
+    assert clear_stored_api_key() is False
+
+
 def test_env_api_key_precedence(monkeypatch):
     save_api_key("local-key")
     monkeypatch.setenv("BING_WEBMASTER_API_KEY", "env-key")
@@ -29,12 +55,6 @@ def test_load_api_key_missing_raises():
         load_api_key()
 
 
-def test_clear_stored_api_key():
-    save_api_key("abc")
-    assert clear_stored_api_key() is True
-    assert credentials_file().exists() is False
-
-
 def test_auth_status_missing():
     status = auth_status()
     assert status["source"] == "missing"
@@ -49,18 +69,21 @@ def test_auth_status_local_masked():
 
 
 def test_invalid_stored_json_raises():
-    path = credentials_file()
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text("not-json", encoding="utf-8")
+    _write_credentials(_NOT_JSON)
 
     with pytest.raises(AuthError, match="invalid JSON"):
         load_api_key()
 
 
 def test_stored_api_key_missing_field_raises():
-    path = credentials_file()
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps({"token": "x"}), encoding="utf-8")
+    _write_credentials(_MISSING_FIELD_JSON)
+
+    with pytest.raises(AuthError, match="missing 'api_key'"):
+        load_api_key()
+
+
+def test_stored_api_key_non_object_json_raises():
+    _write_credentials(_NON_OBJECT_JSON)
 
     with pytest.raises(AuthError, match="missing 'api_key'"):
         load_api_key()
@@ -1,128 +1,132 @@
-from click.testing import CliRunner
-
-from bingwm_cli.cli import cli
-from bingwm_cli.cli import _extract_is_indexed
-from bingwm_cli.output import render_records
+import sys
 
+import pytest
 
-class FakeClient:
-    def __init__(self):
-        self.submitted = None
+from bingwm_cli import __version__
+from bingwm_cli.__main__ import main
+from bingwm_cli.cli import _SUBCOMMAND_HELP, _SUBCOMMANDS, cli
+from bingwm_cli.commands.site import _cmd_site_list
+from bingwm_cli.commands.url import _cmd_url_check_index, _cmd_url_submit, _decode_issue_flags, _extract_is_indexed
+from bingwm_cli.output import render_records
 
-    def get_user_sites(self):
-        return [{"Url": "https://example.com", "PermissionLevel": "Admin"}]
 
-    def get_rank_and_traffic_data(self, site_url, start_date, end_date):
-        assert site_url == "https://example.com"
-        return [{"Date": "2026-02-20", "Clicks": 10, "Impressions": 100}]
+def test_cli_scenarios_with_fake_client(runner, patched_cli):
+    missing_url = "https://example.com/missing"
+    scenarios = [
+        (["site", "list"], ["https://example.com", "Admin"]),
+        (["stats", "site", "--output", "json"], ['"Clicks": 10']),
+        (["url", "check-index", "--url", missing_url, "--output", "json"], ['"isIndexed": false', "NotFound"]),
+    ]
 
-    def get_url_traffic_info(self, site_url, url, start_date, end_date):
-        return [{"Date": "2026-02-20", "Clicks": 3, "Impressions": 25, "Url": url}]
+    for argv, expected in scenarios:
+        result = runner.invoke(cli, argv)
 
-    def get_url_info(self, site_url, url):
-        return {"Url": url, "IsPage": False, "HttpCode": 404}
+        assert result.exit_code == 0, (argv, result.output)
+        for text in expected:
+            assert text in result.output, (argv, text)
 
-    def get_crawl_issues(self, site_url):
-        return [{"Url": "https://example.com/missing", "Issues": 1}]
 
-    def submit_url(self, site_url, url):
-        self.submitted = (site_url, [url])
-        return {"Accepted": True}
+def test_cmd_site_list_normalizes_records(patched_cli):
+    assert _cmd_site_list(patched_cli) == [
+        {"siteUrl": "https://example.com", "permissionLevel": "Admin", "isVerified": None}
+    ]
 
-    def submit_url_batch(self, site_url, urls):
-        self.submitted = (site_url, urls)
-        return {"Accepted": True, "Count": len(urls)}
 
+def test_cmd_url_check_index_explains_crawl_issue(patched_cli):
+    record = _cmd_url_check_index(patched_cli, "https://example.com", "https://example.com/missing", explain=True)
 
-def test_site_list(monkeypatch):
-    runner = CliRunner()
-    fake = FakeClient()
+    assert record["isIndexed"] is False
+    assert record["reason"] == "NotFound"
+    assert record["crawlIssueCode"] == 1
+    assert record["explanation"] == "Crawl issue: NotFound"
 
-    monkeypatch.setattr("bingwm_cli.cli._build_client", lambda write=False: fake)
 
-    result = runner.invoke(cli, ["site", "list"])
+def test_cmd_url_submit_single_url(patched_cli):
+    record = _cmd_url_submit(patched_cli, "https://example.com", ["https://example.com/a"])
 
-    assert result.exit_code == 0
-    assert "https://example.com" in result.output
-    assert "Admin" in result.output
+    assert patched_cli.submitted == ("https://example.com", ["https://example.com/a"])
+    assert record["submittedCount"] == 1
+    assert record["response"] == '{"Accepted":true}'
 
 
-def test_stats_site_uses_default_site(monkeypatch):
-    runner = CliRunner()
-    fake = FakeClient()
+def test_stats_site_normalizes_bing_wrapped_dates(runner, patched_cli, monkeypatch):
+    def fake_stats(site_url, start_date, end_date):
+        assert site_url == "https://example.com"
+        return [{"Date": "Date(1773471600000-0700)", "Clicks": 10, "Impressions": 100}]
 
-    monkeypatch.setattr("bingwm_cli.cli._build_client", lambda write=False: fake)
-    monkeypatch.setattr("bingwm_cli.cli.get_default_site", lambda: "https://example.com")
+    monkeypatch.setattr(patched_cli, "get_rank_and_traffic_data", fake_stats)
 
     result = runner.invoke(cli, ["stats", "site", "--output", "json"])
 
     assert result.exit_code == 0
-    assert '"Clicks": 10' in result.output
+    assert '"Date": "2026-03-14"' in result.output
 
 
-def test_stats_site_normalizes_bing_wrapped_dates(monkeypatch):
-    runner = CliRunner()
-    fake = FakeClient()
+def test_stats_site_help_mentions_local_date_filtering(runner):
+    result = runner.invoke(cli, ["stats", "site", "--help"])
 
-    def fake_stats(site_url, start_date, end_date):
-        assert site_url == "https://example.com"
-        return [{"Date": "Date(1773471600000-0700)", "Clicks": 10, "Impressions": 100}]
+    assert result.exit_code == 0
+    assert "filters returned rows locally" in result.output
 
-    fake.get_rank_and_traffic_data = fake_stats
 
-    monkeypatch.setattr("bingwm_cli.cli._build_client", lambda write=False: fake)
-    monkeypatch.setattr("bingwm_cli.cli.get_default_site", lambda: "https://example.com")
+def test_root_help_lists_lazy_command_groups_without_importing_them(runner, monkeypatch):
+    for module_name in _SUBCOMMANDS.values():
+        monkeypatch.delitem(sys.modules, module_name, raising=False)
 
-    result = runner.invoke(cli, ["stats", "site", "--output", "json"])
+    result = runner.invoke(cli, ["--help"])
 
     assert result.exit_code == 0
-    assert '"Date": "2026-03-14"' in result.output
+    for name, module_name in _SUBCOMMANDS.items():
+        assert f"  {name} " in result.output
+        assert module_name not in sys.modules
 
 
-def test_stats_site_help_mentions_local_date_filtering():
-    runner = CliRunner()
+def test_static_subcommand_help_matches_command_docstrings():
+    for name, short_help in _SUBCOMMAND_HELP.items():
+        assert cli.get_command(None, name).get_short_help_str() == short_help
 
-    result = runner.invoke(cli, ["stats", "site", "--help"])
 
-    assert result.exit_code == 0
-    assert "filters returned rows locally" in result.output
+def test_main_version_fast_path(capsys):
+    main(["--version"])
 
+    assert capsys.readouterr().out == f"bwm, version {__version__}\n"
 
-def test_render_records_clears_bing_sentinel_dates():
-    rendered = render_records(
-        [{"DiscoveryDate": "/Date(-62135568000000-0800)/", "Clicks": 1}],
-        output_format="json",
-    )
 
-    assert '"DiscoveryDate": ""' in rendered
+def test_render_records_clears_bing_sentinel_dates():
+    for placeholder in ("/Date(-62135568000000-0800)/", "/Date(-62135596800000-0800)/", "0001-01-01T00:00:00"):
+        rendered = render_records([{"DiscoveryDate": placeholder, "Clicks": 1}], output_format="json")
 
+        assert '"DiscoveryDate": ""' in rendered, placeholder
 
-def test_url_check_index_prints_reason(monkeypatch):
-    runner = CliRunner()
-    fake = FakeClient()
 
-    monkeypatch.setattr("bingwm_cli.cli._build_client", lambda write=False: fake)
-    monkeypatch.setattr("bingwm_cli.cli.get_default_site", lambda: "https://example.com")
+def test_render_records_csv_merges_columns_across_rows(tmp_path):
+    csv_path = tmp_path / "rows.csv"
 
-    result = runner.invoke(
-        cli,
-        ["url", "check-index", "--url", "https://example.com/missing", "--output", "json"],
+    render_records(
+        [{"Date": "2026-02-20", "Clicks": None}, {"Clicks": 2, "Url": "https://example.com/a,b"}],
+        output_format="csv",
+        csv_path=str(csv_path),
     )
 
-    assert result.exit_code == 0
-    assert '"isIndexed": false' in result.output
-    assert "NotFound" in result.output
+    assert csv_path.read_text(encoding="utf-8").splitlines() == [
+        "Date,Clicks,Url",
+        "2026-02-20,,",
+        ',2,"https://example.com/a,b"',
+    ]
 
 
-def test_url_submit_multiple_urls(monkeypatch, tmp_path):
-    runner = CliRunner()
-    fake = FakeClient()
-    list_file = tmp_path / "urls.txt"
-    list_file.write_text("https://example.com/a\nhttps://example.com/b\n", encoding="utf-8")
+@pytest.fixture(scope="session")
+def url_list_file(tmp_path_factory):
+    path = tmp_path_factory.mktemp("urls") / "urls.txt"
+    # NBSP and U+2028 come from copy-pasted lists; both must be treated as whitespace.
+    path.write_text(
+        "https://example.com/a\xa0\n# skipped\n\u3000https://example.com/b\u2028https://example.com/d\n",
+        encoding="utf-8",
+    )
+    return path
 
-    monkeypatch.setattr("bingwm_cli.cli._build_client", lambda write=False: fake)
-    monkeypatch.setattr("bingwm_cli.cli.get_default_site", lambda: "https://example.com")
 
+def test_url_submit_multiple_urls(runner, patched_cli, url_list_file):
     result = runner.invoke(
         cli,
         [
@@ -131,24 +135,22 @@ def test_url_submit_multiple_urls(monkeypatch, tmp_path):
             "--url",
             "https://example.com/c",
             "--file",
-            str(list_file),
+            str(url_list_file),
             "--output",
             "json",
         ],
     )
 
     assert result.exit_code == 0
-    assert fake.submitted == (
+    assert patched_cli.submitted == (
         "https://example.com",
-        ["https://example.com/c", "https://example.com/a", "https://example.com/b"],
+        ["https://example.com/c", "https://example.com/a", "https://example.com/b", "https://example.com/d"],
     )
-    assert '"submittedCount": 3' in result.output
-
+    assert '"submittedCount": 4' in result.output
 
-def test_auth_login_stores_key(monkeypatch):
-    runner = CliRunner()
 
-    monkeypatch.setattr("bingwm_cli.cli.save_api_key", lambda api_key: "/tmp/creds.json")
+def test_auth_login_stores_key(runner, monkeypatch):
+    monkeypatch.setattr("bingwm_cli.commands.auth.save_api_key", lambda api_key: "/tmp/creds.json")
 
     result = runner.invoke(cli, ["auth", "login", "--api-key", "abc123"])
 
@@ -156,36 +158,38 @@ def test_auth_login_stores_key(monkeypatch):
     assert "Saved API key to /tmp/creds.json" in result.output
 
 
-def test_extract_is_indexed_false_for_uncrawled_placeholder_record():
-    info = {
-        "IsPage": True,
-        "HttpStatus": 0,
-        "DiscoveryDate": "/Date(-62135568000000-0800)/",
-        "LastCrawledDate": "/Date(-62135568000000-0800)/",
-    }
-
-    assert _extract_is_indexed(info) is False
-
-
-def test_url_check_index_explain_adds_explanation(monkeypatch):
-    runner = CliRunner()
-    fake = FakeClient()
-
-    monkeypatch.setattr("bingwm_cli.cli._build_client", lambda write=False: fake)
-    monkeypatch.setattr("bingwm_cli.cli.get_default_site", lambda: "https://example.com")
-
-    result = runner.invoke(
-        cli,
-        [
-            "url",
-            "check-index",
-            "--url",
-            "https://example.com/missing",
-            "--output",
-            "json",
-            "--explain",
-        ],
-    )
-
-    assert result.exit_code == 0
-    assert '"explanation"' in result.output
+def test_extract_is_indexed_cases():
+    sentinel = "/Date(-62135568000000-0800)/"
+    crawled = "/Date(1773471600000-0700)/"
+    cases = [
+        # Uncrawled placeholder record: IsPage=true but nothing was ever fetched.
+        ({"IsPage": True, "HttpStatus": 0, "DiscoveryDate": sentinel, "LastCrawledDate": sentinel}, False),
+        ({"IsIndexed": True, "IsPage": False}, True),
+        ({"IsPage": False, "HttpStatus": 200, "LastCrawledDate": crawled}, False),
+        ({"IsPage": True, "HttpStatus": 200, "LastCrawledDate": crawled}, True),
+        ({"IsPage": True, "HttpStatus": 200, "DiscoveryDate": crawled, "LastCrawledDate": sentinel}, True),
+        ({"IsPage": True, "HttpStatus": 200, "DiscoveryDate": sentinel, "LastCrawledDate": sentinel}, False),
+        ({"IsPage": True, "HttpStatus": 404, "LastCrawledDate": crawled}, False),
+    ]
+
+    for info, expected in cases:
+        assert _extract_is_indexed(info) is expected, info
+
+
+def test_extract_is_indexed_treats_every_epoch_placeholder_as_uncrawled():
+    placeholders = [
+        "/Date(-62135568000000-0800)/",
+        "/Date(-62135596800000-0800)/",
+        "0001-01-01T00:00:00",
+        "/Date(-62135568000000+0000)/",
+    ]
+
+    for placeholder in placeholders:
+        info = {"IsPage": True, "HttpStatus": 200, "DiscoveryDate": placeholder, "LastCrawledDate": placeholder}
+        assert _extract_is_indexed(info) is False, placeholder
+
+
+def test_decode_issue_flags_keeps_flag_order_and_collects_unknown_bits():
+    assert _decode_issue_flags(0) == ["None"]
+    assert _decode_issue_flags(1 | 4 | 256) == ["NotFound", "DisallowedByMetaTag", "UnsupportedContentType"]
+    assert _decode_issue_flags(2 | 512 | 1024) == ["BlockedByRobotsTxt", "Unknown(1536)"]
@@ -1,50 +1,105 @@
+import json
 from datetime import date
+from functools import partial
 
 import pytest
 
-from bingwm_cli.client import BingAPIError, BingWebmasterClient
+from bingwm_cli.client import BingAPIError
+
+
+def _wrap(key, **fields):
+    """Build Bing's ``{"d": {"<Method>Result": {...}}}`` envelope."""
+    return {"d": {key: fields}}
+
+
+# Payloads are shared across tests: the client decodes its own copy from the
+# encoded bytes, so tests never mutate these objects.
+_SITES_PAYLOAD = {"d": {"Results": [{"Url": "https://example.com"}]}}
+_URL_INFO_PAYLOAD = _wrap("GetUrlInfoResult", Url="https://example.com/p", IsPage=True)
+_EMPTY_RANK_PAYLOAD = _wrap("GetRankAndTrafficStatsResult", Results=[])
+_RANK_ROWS_PAYLOAD = _wrap(
+    "GetRankAndTrafficStatsResult",
+    Results=[
+        {"Date": "2026-03-19", "Clicks": 1},
+        {"Date": "2026-03-20", "Clicks": 2},
+        {"Date": "2026-03-21", "Clicks": 3},
+    ],
+)
+_URL_TRAFFIC_OBJECT_PAYLOAD = _wrap(
+    "GetUrlTrafficInfoResult",
+    Url="https://example.com/p",
+    Clicks=2,
+    Impressions=10,
+    IsPage=True,
+)
+_URL_TRAFFIC_ROWS_PAYLOAD = _wrap(
+    "GetUrlTrafficInfoResult",
+    Results=[
+        {"Date": "Date(1773385200000-0700)", "Clicks": 1},
+        {"Date": "Date(1773471600000-0700)", "Clicks": 2},
+    ],
+)
+_BAD_KEY_PAYLOAD = {"Message": "bad key"}
+
+
+def _body(payload):
+    return json.dumps(payload).encode("utf-8")
 
 
 class FakeResponse:
-    def __init__(self, status_code=200, payload=None, text=""):
+    def __init__(self, status_code=200, content=b"{}"):
+        # The client only ever reads ``content``.
         self.status_code = status_code
-        self._payload = payload if payload is not None else {}
-        self.text = text
+        self.content = content
 
-    def json(self):
-        if isinstance(self._payload, Exception):
-            raise self._payload
-        return self._payload
+
+# Responses are never mutated by the client, so every test reuses these instances.
+_RESPONSES = {
+    "sites_ok": FakeResponse(content=_body(_SITES_PAYLOAD)),
+    "url_info_ok": FakeResponse(content=_body(_URL_INFO_PAYLOAD)),
+    "rank_empty": FakeResponse(content=_body(_EMPTY_RANK_PAYLOAD)),
+    "rank_rows": FakeResponse(content=_body(_RANK_ROWS_PAYLOAD)),
+    "url_traffic_object": FakeResponse(content=_body(_URL_TRAFFIC_OBJECT_PAYLOAD)),
+    "url_traffic_rows": FakeResponse(content=_body(_URL_TRAFFIC_ROWS_PAYLOAD)),
+    "submit_ok": FakeResponse(content=_body({"d": None})),
+    "401": FakeResponse(status_code=401, content=_body(_BAD_KEY_PAYLOAD)),
+    "500_not_json": FakeResponse(status_code=500, content=b" Server exploded \n"),
+}
 
 
 class FakeSession:
     def __init__(self, response):
         self.response = response
-        self.last_url = None
-        self.last_json = None
-        self.last_timeout = None
-        self.last_method = None
-
-    def post(self, url, json, timeout):
-        self.last_method = "POST"
-        self.last_url = url
-        self.last_json = json
-        self.last_timeout = timeout
-        return self.response
+        self.last = (None, None, None, None)
+        self.get = partial(self._record, "GET")
+        self.post = partial(self._record, "POST")
 
-    def get(self, url, timeout):
-        self.last_method = "GET"
-        self.last_url = url
-        self.last_timeout = timeout
+    def _record(self, method, url, *, json=None, timeout):
+        self.last = (method, url, json, timeout)
         return self.response
 
+    @property
+    def last_method(self):
+        return self.last[0]
+
+    @property
+    def last_url(self):
+        return self.last[1]
+
+    @property
+    def last_json(self):
+        return self.last[2]
+
+    @property
+    def last_timeout(self):
+        return self.last[3]
 
-def test_get_user_sites_extracts_results():
-    client = BingWebmasterClient("k")
-    fake = FakeSession(FakeResponse(payload={"d": {"Results": [{"Url": "https://example.com"}]}}))
-    client.session = fake
 
-    rows = client.get_user_sites()
+def test_get_user_sites_extracts_results(bing_client):
+    fake = FakeSession(_RESPONSES["sites_ok"])
+    bing_client.session = fake
+
+    rows = bing_client.get_user_sites()
 
     assert len(rows) == 1
     assert rows[0]["Url"] == "https://example.com"
@@ -52,75 +107,43 @@ def test_get_user_sites_extracts_results():
     assert fake.last_method == "GET"
 
 
-def test_get_url_info_extracts_method_result_wrapper():
-    client = BingWebmasterClient("k")
-    fake = FakeSession(
-        FakeResponse(payload={"d": {"GetUrlInfoResult": {"Url": "https://example.com/p", "IsPage": True}}})
-    )
-    client.session = fake
+def test_get_url_info_extracts_method_result_wrapper(bing_client):
+    fake = FakeSession(_RESPONSES["url_info_ok"])
+    bing_client.session = fake
 
-    record = client.get_url_info("https://example.com", "https://example.com/p")
+    record = bing_client.get_url_info("https://example.com", "https://example.com/p")
 
     assert record["IsPage"] is True
     assert fake.last_method == "GET"
 
 
-def test_get_rank_and_traffic_data_formats_dates():
-    client = BingWebmasterClient("k")
-    fake = FakeSession(FakeResponse(payload={"d": {"GetRankAndTrafficStatsResult": {"Results": []}}}))
-    client.session = fake
+def test_get_rank_and_traffic_data_formats_dates(bing_client):
+    fake = FakeSession(_RESPONSES["rank_empty"])
+    bing_client.session = fake
 
-    client.get_rank_and_traffic_data("https://example.com", date(2026, 2, 1), date(2026, 2, 26))
+    bing_client.get_rank_and_traffic_data("https://example.com", date(2026, 2, 1), date(2026, 2, 26))
 
+    assert "?apikey=k&siteUrl=https%3A%2F%2Fexample.com&" in fake.last_url
     assert "startDate=2%2F1%2F2026" in fake.last_url
     assert "endDate=2%2F26%2F2026" in fake.last_url
     assert "GetRankAndTrafficStats" in fake.last_url
     assert fake.last_method == "GET"
 
 
-def test_get_rank_and_traffic_data_filters_rows_to_requested_range():
-    client = BingWebmasterClient("k")
-    fake = FakeSession(
-        FakeResponse(
-            payload={
-                "d": {
-                    "GetRankAndTrafficStatsResult": {
-                        "Results": [
-                            {"Date": "2026-03-19", "Clicks": 1},
-                            {"Date": "2026-03-20", "Clicks": 2},
-                            {"Date": "2026-03-21", "Clicks": 3},
-                        ]
-                    }
-                }
-            }
-        )
-    )
-    client.session = fake
+def test_get_rank_and_traffic_data_filters_rows_to_requested_range(bing_client):
+    fake = FakeSession(_RESPONSES["rank_rows"])
+    bing_client.session = fake
 
-    rows = client.get_rank_and_traffic_data("https://example.com", date(2026, 3, 20), date(2026, 3, 20))
+    rows = bing_client.get_rank_and_traffic_data("https://example.com", date(2026, 3, 20), date(2026, 3, 20))
 
     assert rows == [{"Date": "2026-03-20", "Clicks": 2}]
 
 
-def test_get_url_traffic_info_single_object_wrapped_as_row():
-    client = BingWebmasterClient("k")
-    fake = FakeSession(
-        FakeResponse(
-            payload={
-                "d": {
-                    "GetUrlTrafficInfoResult": {
-                        "Url": "https://example.com/p",
-                        "Clicks": 2,
-                        "Impressions": 10,
-                        "IsPage": True,
-                    }
-                }
-            }
-        )
-    )
-    client.session = fake
+def test_get_url_traffic_info_single_object_wrapped_as_row(bing_client):
+    fake = FakeSession(_RESPONSES["url_traffic_object"])
+    bing_client.session = fake
 
-    rows = client.get_url_traffic_info(
+    rows = bing_client.get_url_traffic_info(
         "https://example.com",
         "https://example.com/p",
         date(2026, 2, 1),
@@ -131,25 +154,11 @@ def test_get_url_traffic_info_single_object_wrapped_as_row():
     assert rows[0]["Url"] == "https://example.com/p"
 
 
-def test_get_url_traffic_info_filters_rows_to_requested_range():
-    client = BingWebmasterClient("k")
-    fake = FakeSession(
-        FakeResponse(
-            payload={
-                "d": {
-                    "GetUrlTrafficInfoResult": {
-                        "Results": [
-                            {"Date": "Date(1773385200000-0700)", "Clicks": 1},
-                            {"Date": "Date(1773471600000-0700)", "Clicks": 2},
-                        ]
-                    }
-                }
-            }
-        )
-    )
-    client.session = fake
+def test_get_url_traffic_info_filters_rows_to_requested_range(bing_client):
+    fake = FakeSession(_RESPONSES["url_traffic_rows"])
+    bing_client.session = fake
 
-    rows = client.get_url_traffic_info(
+    rows = bing_client.get_url_traffic_info(
         "https://example.com",
         "https://example.com/p",
         date(2026, 3, 14),
@@ -159,10 +168,33 @@ def test_get_url_traffic_info_filters_rows_to_requested_range():
     assert rows == [{"Date": "Date(1773471600000-0700)", "Clicks": 2}]
 
 
-def test_api_error_raises_with_status_code():
-    client = BingWebmasterClient("k")
-    fake = FakeSession(FakeResponse(status_code=401, payload={"Message": "bad key"}))
-    client.session = fake
+def test_api_error_raises_with_status_code(bing_client):
+    fake = FakeSession(_RESPONSES["401"])
+    bing_client.session = fake
 
     with pytest.raises(BingAPIError, match="401"):
-        client.get_user_sites()
+        bing_client.get_user_sites()
+
+
+def test_api_error_falls_back_to_raw_body_text(bing_client):
+    fake = FakeSession(_RESPONSES["500_not_json"])
+    bing_client.session = fake
+
+    with pytest.raises(BingAPIError, match=r"\(500\): Server exploded$") as excinfo:
+        bing_client.get_user_sites()
+
+    assert excinfo.value.payload == {}
+
+
+def test_submit_url_batch_posts_json_payload(bing_client):
+    fake = FakeSession(_RESPONSES["submit_ok"])
+    bing_client.session = fake
+
+    bing_client.submit_url_batch("https://example.com", ["https://example.com/a"])
+
+    assert fake.last == (
+        "POST",
+        f"{bing_client.base_url}/SubmitUrlBatch?apikey=k",
+        {"siteUrl": "https://example.com", "urlList": ["https://example.com/a"]},
+        30,
+    )